@@ -46,7 +46,9 @@ class Miner(BaseMinerNeuron):
         from ``synapse.dummy_input`` (or your protocol fields).
         """
         # Replace with your protocol logic.
-        synapse.dummy_output = synapse.dummy_input * 2
+        # bt.Synapse validates every attribute assignment; the output here is derived
+        # from an already-validated int, so set it directly to skip that per request.
+        object.__setattr__(synapse, "dummy_output", synapse.dummy_input * 2)
         return synapse
 
     async def blacklist(self, synapse: Dummy) -> typing.Tuple[bool, str]:
@@ -61,21 +63,20 @@ class Miner(BaseMinerNeuron):
             return True, "Missing dendrite or hotkey"
 
         hotkey = synapse.dendrite.hotkey
+        uid = self._hotkey_to_uid.get(hotkey)
         if not self.config.blacklist.allow_non_registered:
-            if hotkey not in self.metagraph.hotkeys:
+            if uid is None:
                 bt.logging.trace(f"Blacklisting un-registered hotkey {hotkey}")
                 return True, "Unrecognized hotkey"
 
         if self.config.blacklist.force_validator_permit:
-            try:
-                uid = self.metagraph.hotkeys.index(hotkey)
-                if not self.metagraph.validator_permit[uid]:
-                    bt.logging.warning(
-                        f"Blacklisting non-validator hotkey {hotkey}"
-                    )
-                    return True, "Non-validator hotkey"
-            except ValueError:
+            if uid is None:
                 return True, "Unrecognized hotkey"
+            if not self._validator_permit[uid]:
+                bt.logging.warning(
+                    f"Blacklisting non-validator hotkey {hotkey}"
+                )
+                return True, "Non-validator hotkey"
 
         bt.logging.trace(f"Allowing hotkey {hotkey}")
         return False, "Hotkey recognized!"
@@ -88,15 +89,14 @@ class Miner(BaseMinerNeuron):
         """
         if synapse.dendrite is None or synapse.dendrite.hotkey is None:
             return 0.0
-        try:
-            uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-            p = float(self.metagraph.S[uid])
-            bt.logging.trace(
-                f"Priority for {synapse.dendrite.hotkey}: {p}"
-            )
-            return p
-        except ValueError:
+        uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+        if uid is None:
             return 0.0
+        p = float(self._priority_keys[uid])
+        bt.logging.trace(
+            f"Priority for {synapse.dendrite.hotkey}: {p}"
+        )
+        return p
 
 
 if __name__ == "__main__":
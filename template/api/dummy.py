@@ -43,10 +43,9 @@ class DummyAPI(SubnetsAPI):
         self, responses: List[Union["bt.Synapse", Any]]
     ) -> List[int]:
         """Process responses and extract dummy_output values."""
-        outputs = []
-        for response in responses:
-            if response.dendrite.status_code != 200:
-                continue
-            if hasattr(response, 'dummy_output') and response.dummy_output is not None:
-                outputs.append(response.dummy_output)
-        return outputs
+        return [
+            output
+            for response in responses
+            if response.dendrite.status_code == 200
+            and (output := getattr(response, "dummy_output", None)) is not None
+        ]
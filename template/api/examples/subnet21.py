@@ -23,14 +23,19 @@ Example API client for Storage Subnet 21.
 Requires the storage-subnet package: https://github.com/ifrit98/storage-subnet
 """
 
-import base64
+import asyncio
 import bittensor as bt
 from typing import Any, List, Union
 
 from bittensor.subnets import SubnetsAPI
 
+# pybase64 is a SIMD-accelerated drop-in for the stdlib base64 codec; use it when available.
+try:
+    import pybase64 as b64
+except ImportError:
+    import base64 as b64
+
 try:
-    from storage.validator.cid import generate_cid_string
     from storage.validator.encryption import (
         encrypt_data,
         decrypt_data_with_private_key,
@@ -41,7 +46,6 @@ except ImportError:
     bt.logging.warning(
         f"Storage Subnet 21 not installed. Install the package to use this example: {storage_url}"
     )
-    generate_cid_string = None
     encrypt_data = None
     decrypt_data_with_private_key = None
     StoreUser = None  # type: ignore[misc, assignment]
@@ -68,8 +72,7 @@ class StoreUserAPI(SubnetsAPI):
         encrypted_data, encryption_payload = (
             encrypt_data(data, self.wallet) if encrypt else (data, "{}")
         )
-        expected_cid = generate_cid_string(encrypted_data)
-        encoded_data = base64.b64encode(encrypted_data)
+        encoded_data = b64.b64encode(encrypted_data)
 
         synapse = StoreUser(
             encrypted_data=encoded_data,
@@ -85,17 +88,18 @@ class StoreUserAPI(SubnetsAPI):
         success = False
         failure_modes = {"code": [], "message": []}
         for response in responses:
-            if response.dendrite.status_code != 200:
-                failure_modes["code"].append(response.dendrite.status_code)
-                failure_modes["message"].append(
-                    response.dendrite.status_message
-                )
+            dendrite = response.dendrite
+            status_code = dendrite.status_code
+            if status_code != 200:
+                failure_modes["code"].append(status_code)
+                failure_modes["message"].append(dendrite.status_message)
                 continue
 
+            data_hash = response.data_hash
             stored_cid = (
-                response.data_hash.decode("utf-8")
-                if isinstance(response.data_hash, bytes)
-                else response.data_hash
+                data_hash.decode("utf-8")
+                if isinstance(data_hash, bytes)
+                else data_hash
             )
             bt.logging.debug("received data CID: {}".format(stored_cid))
             success = True
@@ -144,7 +148,7 @@ class RetrieveUserAPI(SubnetsAPI):
             bt.logging.trace(
                 f"encrypted_data: {response.encrypted_data[:100]}"
             )
-            encrypted_data = base64.b64decode(response.encrypted_data)
+            encrypted_data = b64.b64decode(response.encrypted_data, validate=False)
             bt.logging.debug(
                 f"encryption_payload: {response.encryption_payload}"
             )
@@ -177,6 +181,70 @@ class RetrieveUserAPI(SubnetsAPI):
         return decrypted_data
 
 
+async def store_many(
+    store_handler: StoreUserAPI,
+    axons: list,
+    data_list: List[bytes],
+    max_batch_size: int = 8,
+    timeout: float = 12,
+    **kwargs,
+) -> List[str]:
+    """
+    Stores several payloads concurrently instead of awaiting each store in turn.
+
+    Args:
+        store_handler: The StoreUserAPI used to send each request.
+        axons: The axons to store the data on.
+        data_list: The payloads to store.
+        max_batch_size: Maximum number of store requests in flight at once. Defaults to 8.
+        timeout: Timeout in seconds for each store request. Defaults to 12.
+        **kwargs: Extra arguments forwarded to StoreUserAPI.prepare_synapse (e.g. encrypt, ttl).
+
+    Returns:
+        The CIDs in the same order as ``data_list``; an empty string marks a failed store.
+    """
+    semaphore = asyncio.Semaphore(max_batch_size)
+
+    async def store(data: bytes) -> str:
+        async with semaphore:
+            return await store_handler(
+                axons=axons, timeout=timeout, data=data, **kwargs
+            )
+
+    return await asyncio.gather(*(store(data) for data in data_list))
+
+
+async def retrieve_many(
+    retrieve_handler: RetrieveUserAPI,
+    axons: list,
+    cids: List[str],
+    max_batch_size: int = 8,
+    timeout: float = 12,
+) -> List[bytes]:
+    """
+    Retrieves several CIDs concurrently instead of awaiting each retrieve in turn.
+
+    Args:
+        retrieve_handler: The RetrieveUserAPI used to send each request.
+        axons: The axons to retrieve the data from.
+        cids: The CIDs to retrieve.
+        max_batch_size: Maximum number of retrieve requests in flight at once. Defaults to 8.
+        timeout: Timeout in seconds for each retrieve request. Defaults to 12.
+
+    Returns:
+        The retrieved data in the same order as ``cids``; empty bytes mark a failed retrieve.
+    """
+    semaphore = asyncio.Semaphore(max_batch_size)
+
+    async def retrieve(cid: str) -> bytes:
+        async with semaphore:
+            return await retrieve_handler(
+                axons=axons, timeout=timeout, cid=cid
+            )
+
+    return await asyncio.gather(*(retrieve(cid) for cid in cids))
+
+
 async def test_store_and_retrieve(
     netuid: int = 22, wallet: "bt.wallet" = None
 ):
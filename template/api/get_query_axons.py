@@ -18,18 +18,29 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
+import math
+import asyncio
 import numpy as np
-import random
 import bittensor as bt
 
 
+# Dendrites built by get_query_api_axons, keyed by wallet hotkey ss58 address, so
+# repeated calls reuse one client session instead of constructing a new dendrite.
+# A dendrite's aiohttp session is bound to the event loop that first used it, so each
+# entry records that loop and is replaced when called from a different one (e.g. a
+# second asyncio.run).
+_dendrite_cache: Dict[str, Tuple[asyncio.AbstractEventLoop, "bt.dendrite"]] = {}
+
+
 async def ping_uids(
     dendrite: "bt.dendrite",
     metagraph: "bt.metagraph",
     uids: List[int],
     timeout: float = 3,
+    target: Optional[int] = None,
+    concurrency: int = 16,
 ) -> tuple:
     """
     Pings a list of UIDs to check their availability on the Bittensor network.
@@ -39,12 +50,22 @@ async def ping_uids(
         metagraph: The metagraph instance containing network information.
         uids: A list of UIDs (unique identifiers) to ping.
         timeout (int, optional): The timeout in seconds for each ping. Defaults to 3.
+        target (int, optional): Stop as soon as this many UIDs have responded successfully,
+            cancelling the outstanding pings. Defaults to None (wait for every UID).
+        concurrency (int, optional): The maximum number of pings in flight when ``target``
+            is set. Defaults to 16.
 
     Returns:
         tuple: A tuple containing two lists:
             - The first list contains UIDs that were successfully pinged.
-            - The second list contains UIDs that failed to respond.
+            - The second list contains UIDs that failed to respond (or were not
+              waited on once ``target`` was reached).
     """
+    if target is not None:
+        return await _ping_uids_until(
+            dendrite, metagraph, uids, timeout, target, concurrency
+        )
+
     axons = [metagraph.axons[uid] for uid in uids]
     try:
         responses = await dendrite(
@@ -53,16 +74,13 @@ async def ping_uids(
             deserialize=False,
             timeout=timeout,
         )
-        successful_uids = [
-            uid
-            for uid, response in zip(uids, responses)
-            if response.dendrite.status_code == 200
-        ]
-        failed_uids = [
-            uid
-            for uid, response in zip(uids, responses)
-            if response.dendrite.status_code != 200
-        ]
+        successful_uids, failed_uids = [], []
+        for uid, response in zip(uids, responses):
+            (
+                successful_uids
+                if response.dendrite.status_code == 200
+                else failed_uids
+            ).append(uid)
     except Exception as e:
         bt.logging.error(f"Dendrite ping failed: {e}")
         successful_uids = []
@@ -71,6 +89,61 @@ async def ping_uids(
     bt.logging.debug(f"ping() failed uids    : {failed_uids}")
     return successful_uids, failed_uids
 
+
+async def _ping_uids_until(
+    dendrite: "bt.dendrite",
+    metagraph: "bt.metagraph",
+    uids: List[int],
+    timeout: float,
+    target: int,
+    concurrency: int,
+) -> tuple:
+    """
+    Pings UIDs individually, at most ``concurrency`` at a time, and returns once
+    ``target`` of them have succeeded.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def ping(uid: int) -> tuple:
+        async with semaphore:
+            try:
+                responses = await dendrite(
+                    [metagraph.axons[uid]],
+                    bt.Synapse(),
+                    deserialize=False,
+                    timeout=timeout,
+                )
+            except Exception as e:
+                bt.logging.debug(f"Dendrite ping of uid {uid} failed: {e}")
+                return uid, False
+        return uid, responses[0].dendrite.status_code == 200
+
+    # Pings queued behind the semaphore run in waves, each bounded by ``timeout``.
+    deadline = timeout * max(1, math.ceil(len(uids) / concurrency))
+    successful_uids = []
+    tasks = [asyncio.ensure_future(ping(uid)) for uid in uids]
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=deadline):
+            uid, ok = await next_done
+            if ok:
+                successful_uids.append(uid)
+                if len(successful_uids) >= target:
+                    break
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let the cancellations land so no ping outlives this call.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    successful = set(successful_uids)
+    failed_uids = [uid for uid in uids if uid not in successful]
+    bt.logging.debug(f"ping() successful uids: {successful_uids}")
+    bt.logging.debug(f"ping() failed uids    : {failed_uids}")
+    return successful_uids, failed_uids
+
+
 async def get_query_api_nodes(
     dendrite: "bt.dendrite",
     metagraph: "bt.metagraph",
@@ -92,21 +165,23 @@ async def get_query_api_nodes(
     bt.logging.debug(
         f"Fetching available API nodes for subnet {metagraph.netuid}"
     )
-    vtrust_uids = [
-        uid.item()
-        for uid in metagraph.uids
-        if metagraph.validator_trust[uid] > 0
-    ]
-    top_uids = np.where(metagraph.S > np.quantile(metagraph.S, 1 - n))[0].tolist()
-    init_query_uids = set(top_uids).intersection(set(vtrust_uids))
+    # Select the top-n fraction of nodes by stake (O(N) partition rather than a
+    # full sort) that also have non-zero validator trust.
+    S = np.asarray(metagraph.S)
+    if S.size == 0:
+        return []
+    vtrust = np.asarray(metagraph.validator_trust) > 0
+    k = min(S.size, max(1, int(np.ceil(n * S.size))))
+    top_uids = np.argpartition(S, S.size - k)[-k:]
+    top_mask = np.zeros(S.size, dtype=bool)
+    top_mask[top_uids] = True
+    init_query_uids = np.flatnonzero(top_mask & vtrust).tolist()
     query_uids, _ = await ping_uids(
-        dendrite, metagraph, list(init_query_uids), timeout=timeout
+        dendrite, metagraph, init_query_uids, timeout=timeout, target=3
     )
     bt.logging.debug(
         f"Available API node UIDs for subnet {metagraph.netuid}: {query_uids}"
     )
-    if len(query_uids) > 3:
-        query_uids = random.sample(query_uids, 3)
     return query_uids
 
 
@@ -116,6 +191,7 @@ async def get_query_api_axons(
     n: float = 0.1,
     timeout: float = 3,
     uids: Optional[Union[List[int], int]] = None,
+    dendrite: Optional["bt.dendrite"] = None,
 ) -> list:
     """
     Retrieves the axons of query API nodes based on their availability and stake.
@@ -126,11 +202,20 @@ async def get_query_api_axons(
         n: The fraction of top nodes to consider based on stake. Defaults to 0.1.
         timeout: The timeout in seconds for pinging nodes. Defaults to 3.
         uids: The specific UID(s) of the API node(s) to query. Defaults to None.
+        dendrite: The dendrite to ping nodes with. If None, a dendrite for the wallet is
+            created on first use and reused by later calls with the same wallet on the
+            same event loop.
 
     Returns:
         A list of axon objects for the available API nodes.
     """
-    dendrite = bt.dendrite(wallet=wallet)
+    if dendrite is None:
+        hotkey = wallet.hotkey.ss58_address
+        loop = asyncio.get_running_loop()
+        cached_loop, dendrite = _dendrite_cache.get(hotkey, (None, None))
+        if cached_loop is not loop:
+            dendrite = bt.dendrite(wallet=wallet)
+            _dendrite_cache[hotkey] = (loop, dendrite)
 
     if metagraph is None:
         metagraph = bt.metagraph(netuid=1)  # Template default netuid
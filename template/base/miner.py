@@ -21,12 +21,13 @@ import threading
 import argparse
 import traceback
 
+import numpy as np
 import bittensor as bt
 
 from template.base.neuron import BaseNeuron
 from template.utils.config import add_miner_args
 
-from typing import Union
+from typing import Dict, Union
 
 class BaseMinerNeuron(BaseNeuron):
     """
@@ -71,6 +72,9 @@ class BaseMinerNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+        # Build the hotkey -> uid lookup used by blacklist/priority.
+        self._rebuild_hotkey_index()
+
     def run(self):
         """
         Initiates and manages the main loop for the miner on the Bittensor network. The main loop handles graceful shutdown on keyboard interrupts and logs unforeseen errors.
@@ -195,12 +199,30 @@ class BaseMinerNeuron(BaseNeuron):
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
         
+        self._rebuild_hotkey_index()
+
         # Update UID if it has changed
-        try:
-            self.uid = self.metagraph.hotkeys.index(
-                self.wallet.hotkey.ss58_address
-            )
-        except ValueError:
+        uid = self._hotkey_to_uid.get(self.wallet.hotkey.ss58_address)
+        if uid is None:
             bt.logging.warning(
                 f"Hotkey {self.wallet.hotkey.ss58_address} not found in metagraph after sync."
-            )
\ No newline at end of file
+            )
+        else:
+            self.uid = uid
+
+    def _rebuild_hotkey_index(self):
+        """
+        Rebuilds the per-sync lookup tables used on the request path.
+
+        blacklist and priority run for every incoming synapse, so they use an O(1)
+        hotkey -> uid dict and NumPy copies of validator_permit and stake instead of
+        scanning metagraph.hotkeys and indexing tensors per request.
+        """
+        self._hotkey_to_uid: Dict[str, int] = {
+            hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)
+        }
+        self._validator_permit = np.asarray(
+            self.metagraph.validator_permit, dtype=bool
+        )
+        # Stake is the default priority key; precompute it as float64 once per sync.
+        self._priority_keys = np.asarray(self.metagraph.S, dtype=np.float64)
@@ -26,7 +26,7 @@ import argparse
 import threading
 import bittensor as bt
 
-from typing import List, Union
+from typing import List, Optional, Union
 from traceback import print_exception
 
 from template.base.neuron import BaseNeuron
@@ -66,6 +66,15 @@ class BaseValidatorNeuron(BaseNeuron):
             self.metagraph.n, dtype=np.float32
         )
 
+        # Available uids for the current metagraph, see get_cached_available_uids.
+        self._avail_uids_cache: Optional[np.ndarray] = None
+
+        # Random generator used to sample miner uids.
+        self._rng = np.random.default_rng()
+
+        # Snapshot of metagraph.axons for uid -> axon lookups, refreshed on resync.
+        self._axons_tuple = tuple(self.metagraph.axons)
+
         # Init sync with the network. Updates the metagraph.
         self.sync()
 
@@ -76,7 +85,7 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.warning("axon off, not serving ip to chain.")
 
         # Create asyncio event loop to manage async tasks.
-        self.loop = asyncio.get_event_loop()
+        self.loop = self._make_forward_loop()
 
         # Instantiate runners
         self.should_exit: bool = False
@@ -84,6 +93,28 @@ class BaseValidatorNeuron(BaseNeuron):
         self.thread: Union[threading.Thread, None] = None
         self.lock = asyncio.Lock()
 
+    def _make_forward_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop that drives forward passes.
+
+        With ``--neuron.uvloop`` a new uvloop (libuv) loop is created and installed, which
+        batches socket readiness handling for the dendrite fan-out. Without the flag, or if
+        uvloop is not installed, the existing default asyncio loop is returned.
+        """
+        if self.config.neuron.uvloop:
+            try:
+                import uvloop
+
+                loop = uvloop.new_event_loop()
+                asyncio.set_event_loop(loop)
+                bt.logging.info("Using uvloop event loop.")
+                return loop
+            except ImportError:
+                bt.logging.warning(
+                    "neuron.uvloop is set but uvloop is not installed. Falling back to the default asyncio event loop."
+                )
+        return asyncio.get_event_loop()
+
     def serve_axon(self):
         """Serve axon to enable external connections."""
 
@@ -293,6 +324,10 @@ class BaseValidatorNeuron(BaseNeuron):
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
 
+        # Stake and serving state may have changed even if the axons did not.
+        self._avail_uids_cache = None
+        self._axons_tuple = tuple(self.metagraph.axons)
+
         # Check if the metagraph axon info has changed.
         if previous_metagraph.axons == self.metagraph.axons:
             return
@@ -320,13 +355,15 @@ class BaseValidatorNeuron(BaseNeuron):
         # Update the hotkeys.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
-    def update_scores(self, rewards: np.ndarray, uids: List[int]) -> None:
+    def update_scores(
+        self, rewards: np.ndarray, uids: Union[np.ndarray, List[int]]
+    ) -> None:
         """
         Performs exponential moving average on the scores based on the rewards received from the miners.
         
         Args:
             rewards: Array of reward values for each UID.
-            uids: List of UIDs corresponding to the rewards.
+            uids: Array (or list) of UIDs corresponding to the rewards.
         """
         # Check if rewards contains NaN values.
         if np.isnan(rewards).any():
@@ -334,14 +371,9 @@ class BaseValidatorNeuron(BaseNeuron):
             # Replace any NaN values in rewards with 0.
             rewards = np.nan_to_num(rewards, nan=0.0)
 
-        # Ensure rewards is a numpy array.
+        # Ensure rewards and uids are numpy arrays.
         rewards = np.asarray(rewards)
-
-        # Check if `uids` is already a numpy array and copy it to avoid the warning.
-        if isinstance(uids, np.ndarray):
-            uids_array = uids.copy()
-        else:
-            uids_array = np.array(uids)
+        uids_array = np.asarray(uids, dtype=np.int64)
 
         # Handle edge case: If either rewards or uids_array is empty.
         if rewards.size == 0 or uids_array.size == 0:
@@ -356,10 +388,6 @@ class BaseValidatorNeuron(BaseNeuron):
                 f"cannot be broadcast to uids array of shape {uids_array.shape}"
             )
 
-        # Compute forward pass rewards, assumes uids are mutually exclusive.
-        # shape: [ metagraph.n ]
-        scattered_rewards: np.ndarray = np.zeros_like(self.scores, dtype=np.float32)
-        
         # Ensure uids are within valid range
         valid_mask = (uids_array >= 0) & (uids_array < len(self.scores))
         if not np.all(valid_mask):
@@ -367,15 +395,15 @@ class BaseValidatorNeuron(BaseNeuron):
             bt.logging.warning(f"Invalid UIDs detected: {invalid_uids}. Skipping these.")
             uids_array = uids_array[valid_mask]
             rewards = rewards[valid_mask]
-        
-        if len(uids_array) > 0:
-            scattered_rewards[uids_array] = rewards
-            bt.logging.debug(f"Scattered rewards: {rewards}")
 
-        # Update scores with rewards produced by this step.
+        # Update scores in place with rewards produced by this step: every score decays,
+        # and the queried uids gain alpha * reward. Assumes uids are mutually exclusive.
         # shape: [ metagraph.n ]
         alpha: float = self.config.neuron.moving_average_alpha
-        self.scores = (alpha * scattered_rewards + (1 - alpha) * self.scores).astype(np.float32)
+        self.scores *= 1 - alpha
+        if uids_array.size > 0:
+            self.scores[uids_array] += alpha * rewards
+            bt.logging.debug(f"Scattered rewards: {rewards}")
         bt.logging.debug(f"Updated moving avg scores: {self.scores}")
 
     def save_state(self) -> None:
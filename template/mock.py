@@ -1,7 +1,5 @@
-import time
-
 import asyncio
-import random
+import numpy as np
 import bittensor as bt
 
 from typing import List
@@ -36,6 +34,9 @@ class MockSubtensor(bt.MockSubtensor):
 
 
 class MockMetagraph(bt.metagraph):
+    default_ip = "127.0.0.0"
+    default_port = 8091
+
     def __init__(self, netuid=1, network="mock", subtensor=None):
         super().__init__(netuid=netuid, network=network, sync=False)
 
@@ -44,8 +45,8 @@ class MockMetagraph(bt.metagraph):
         self.sync(subtensor=subtensor)
 
         for axon in self.axons:
-            axon.ip = "127.0.0.0"
-            axon.port = 8091
+            axon.ip = self.default_ip
+            axon.port = self.default_port
 
         bt.logging.info(f"Metagraph: {self}")
         bt.logging.info(f"Axons: {self.axons}")
@@ -87,31 +88,32 @@ class MockDendrite(bt.dendrite):
         if streaming:
             raise NotImplementedError("Streaming not implemented yet.")
 
+        # Deep-copy the request once. Per-axon copies of this template can be shallow
+        # because attach_terminal_info assigns fresh dendrite/axon terminal info, and
+        # only those and the outputs differ per axon.
+        template = synapse.model_copy(deep=True)
+
         async def query_all_axons():
             """Queries all axons for responses."""
+            # Draw each axon's simulated processing time up front and wait once for the
+            # slowest one, capped at the timeout like a real dendrite.
+            process_times = np.random.uniform(self.min_time, self.max_time, len(axons))
+            if len(axons) > 0:
+                await asyncio.sleep(min(float(process_times.max()), timeout))
+
+            responses = []
+            for axon, process_time in zip(axons, process_times):
+                s = template.model_copy()
 
-            async def single_axon_response(i, axon):
-                """Queries a single axon for a response."""
-                start_time = time.time()
-                s = synapse.copy()
-                
                 # Attach some more required data so it looks real
-                s = self.preprocess_synapse_for_request(axon, s, timeout)
-                
-                # Generate random process time within configured range
-                process_time = random.uniform(self.min_time, self.max_time)
-                
-                # Simulate processing delay
-                await asyncio.sleep(process_time)
-                
-                actual_time = time.time() - start_time
-                
+                s = self.attach_terminal_info(axon, s, timeout)
+
                 # Determine response based on timing
-                if actual_time >= timeout:
+                if process_time >= timeout:
                     s.dummy_output = s.dummy_input if hasattr(s, 'dummy_input') else 0
                     s.dendrite.status_code = 408
                     s.dendrite.status_message = "Timeout"
-                    s.dendrite.process_time = str(actual_time)
+                    s.dendrite.process_time = str(process_time)
                 else:
                     # Update the status code and status message of the dendrite to match the axon
                     # TODO (developer): replace with your own expected synapse data
@@ -119,23 +121,38 @@ class MockDendrite(bt.dendrite):
                         s.dummy_output = s.dummy_input * 2
                     s.dendrite.status_code = 200
                     s.dendrite.status_message = "OK"
-                    s.dendrite.process_time = str(actual_time)
+                    s.dendrite.process_time = str(process_time)
 
                 # Return the updated synapse object after deserializing if requested
-                if deserialize:
-                    return s.deserialize()
-                else:
-                    return s
+                responses.append(s.deserialize() if deserialize else s)
 
-            return await asyncio.gather(
-                *(
-                    single_axon_response(i, target_axon)
-                    for i, target_axon in enumerate(axons)
-                )
-            )
+            return responses
 
         return await query_all_axons()
 
+    def attach_terminal_info(
+        self, axon: bt.axon, synapse: bt.Synapse, timeout: float
+    ) -> bt.Synapse:
+        """
+        Cheap stand-in for ``preprocess_synapse_for_request``.
+
+        Fills in the dendrite and axon terminal info a real request would carry, but
+        skips nonce generation and signing, which a mock request does not need.
+        """
+        axon_info = axon.info() if isinstance(axon, bt.axon) else axon
+        synapse.timeout = timeout
+        synapse.dendrite = bt.TerminalInfo(
+            ip=self.external_ip,
+            uuid=self.uuid,
+            hotkey=self.keypair.ss58_address,
+        )
+        synapse.axon = bt.TerminalInfo(
+            ip=axon_info.ip,
+            port=axon_info.port,
+            hotkey=axon_info.hotkey,
+        )
+        return synapse
+
     async def __call__(
         self,
         axons: List[bt.axon],
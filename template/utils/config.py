@@ -228,6 +228,13 @@ def add_validator_args(cls, parser):
         default=4096,
     )
 
+    parser.add_argument(
+        "--neuron.uvloop",
+        action="store_true",
+        help="Run the validator event loop on uvloop (if installed) to cut per-socket syscall overhead when querying miners.",
+        default=False,
+    )
+
     parser.add_argument(
         "--wandb.project_name",
         type=str,
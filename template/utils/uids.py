@@ -1,7 +1,6 @@
-import random
 import bittensor as bt
 import numpy as np
-from typing import List, Optional
+from typing import Collection, Optional
 
 
 def check_uid_availability(
@@ -26,14 +25,61 @@ def check_uid_availability(
     return True
 
 
+def get_available_uids(
+    metagraph: "bt.metagraph.Metagraph", vpermit_tao_limit: int
+) -> np.ndarray:
+    """Returns every uid that passes :func:`check_uid_availability`, computed with NumPy masks.
+    Args:
+        metagraph (:obj: bt.metagraph.Metagraph): Metagraph object
+        vpermit_tao_limit (int): Validator permit tao limit
+    Returns:
+        np.ndarray: Sorted array of available uids.
+    """
+    # Flatten the per-axon serving flags into a bool array (AoS -> SoA) without an
+    # intermediate Python list.
+    axons = metagraph.axons
+    is_serving = np.fromiter(
+        (axon.is_serving for axon in axons), dtype=bool, count=len(axons)
+    )
+    vpermit = np.asarray(metagraph.validator_permit, dtype=bool)
+    S = np.asarray(metagraph.S)
+    available = is_serving & ~(vpermit & (S > vpermit_tao_limit))
+    return np.flatnonzero(available)
+
+
+def get_cached_available_uids(self) -> np.ndarray:
+    """Returns the available uids for the neuron, recomputing them only when the metagraph changes.
+
+    The result is cached on the neuron as ``_avail_uids_cache`` together with a cheap
+    ``(n, block)`` signature of the metagraph it was computed from. ``resync_metagraph``
+    also clears the cache explicitly.
+
+    Args:
+        self: The neuron holding the metagraph and config.
+    Returns:
+        np.ndarray: Sorted array of available uids.
+    """
+    signature = (int(self.metagraph.n), int(self.metagraph.block))
+    if (
+        getattr(self, "_avail_uids_cache", None) is None
+        or getattr(self, "_avail_signature", None) != signature
+    ):
+        self._avail_uids_cache = get_available_uids(
+            self.metagraph, self.config.neuron.vpermit_tao_limit
+        )
+        self._avail_signature = signature
+    return self._avail_uids_cache
+
+
 def get_random_uids(
-    self, k: int, exclude: Optional[List[int]] = None
+    self, k: int, exclude: Optional[Collection[int]] = None
 ) -> np.ndarray:
     """Returns k available random uids from the metagraph.
     
     Args:
         k (int): Number of uids to return.
-        exclude (Optional[List[int]]): List of uids to exclude from the random sampling.
+        exclude (Optional[Collection[int]]): Uids to exclude from the random sampling. Callers
+            reusing the same exclusions across calls can pass a prebuilt frozenset.
     
     Returns:
         np.ndarray: Randomly sampled available uids.
@@ -41,37 +87,40 @@ def get_random_uids(
     Notes:
         If `k` is larger than the number of available `uids`, set `k` to the number of available `uids`.
     """
-    if exclude is None:
-        exclude = []
-    
-    exclude_set = set(exclude)
-    candidate_uids = []
-    avail_uids = []
-    vpermit_limit = self.config.neuron.vpermit_tao_limit
-
-    # Single pass to collect available UIDs
-    for uid in range(self.metagraph.n.item()):
-        if check_uid_availability(self.metagraph, uid, vpermit_limit):
-            avail_uids.append(uid)
-            if uid not in exclude_set:
-                candidate_uids.append(uid)
-    
+    avail_uids = get_cached_available_uids(self)
+
     # If k is larger than the number of available uids, set k to the number of available uids.
-    k = min(k, len(avail_uids))
-    
+    k = min(k, avail_uids.size)
+
     if k == 0:
         return np.array([], dtype=np.int64)
-    
-    # Check if candidate_uids contain enough for querying, if not grab all available uids
-    if len(candidate_uids) < k:
-        # Add excluded but available uids to reach k
-        excluded_available = [uid for uid in avail_uids if uid in exclude_set]
-        needed = k - len(candidate_uids)
-        if excluded_available:
-            candidate_uids.extend(random.sample(excluded_available, min(needed, len(excluded_available))))
-    
-    # Ensure we have enough uids
-    if len(candidate_uids) < k:
-        k = len(candidate_uids)
-    
-    return np.array(random.sample(candidate_uids, k), dtype=np.int64)
+
+    # Reuse the neuron's generator so its state is not rebuilt on every call.
+    rng = getattr(self, "_rng", None)
+    if rng is None:
+        rng = self._rng = np.random.default_rng()
+
+    if exclude is None or len(exclude) == 0:
+        candidate_uids = avail_uids
+    else:
+        exclude_mask = np.isin(avail_uids, np.fromiter(exclude, dtype=np.int64))
+        candidate_uids = avail_uids[~exclude_mask]
+
+        # Check if candidate_uids contain enough for querying, if not add excluded but available uids to reach k
+        if candidate_uids.size < k:
+            excluded_available = avail_uids[exclude_mask]
+            candidate_uids = np.concatenate(
+                [
+                    candidate_uids,
+                    rng.choice(
+                        excluded_available,
+                        k - candidate_uids.size,
+                        replace=False,
+                        shuffle=False,
+                    ),
+                ]
+            )
+
+    return rng.choice(candidate_uids, k, replace=False, shuffle=False).astype(
+        np.int64, copy=False
+    )
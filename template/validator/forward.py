@@ -17,16 +17,78 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import logging
 import bittensor as bt
-from typing import TYPE_CHECKING
+from operator import itemgetter
+from typing import TYPE_CHECKING, List
 
 from template.protocol import Dummy
-from template.validator.reward import get_rewards
+from template.validator.reward import get_rewards, responses_to_array
 from template.utils.uids import get_random_uids
 
 if TYPE_CHECKING:
     from template.base.validator import BaseValidatorNeuron
 
+# Underlying stdlib logger of bt.logging, used to check the active level.
+_bt_logger = logging.getLogger("bittensor")
+
+# Failures of a single query that count as a missing response rather than a validator error.
+_NETWORK_ERRORS = (asyncio.TimeoutError, ConnectionError)
+
+
+async def query_miners(
+    self: "BaseValidatorNeuron", axons: List["bt.AxonInfo"], synapse: "bt.Synapse"
+) -> list:
+    """
+    Queries each axon as its own task so one failing query cannot take down the others.
+
+    ``bt.dendrite`` already sends its per-axon requests concurrently; splitting them here
+    only isolates failures. The number of in-flight queries is capped at
+    ``neuron.sample_size * neuron.num_concurrent_forwards``, shared by every concurrent
+    forward pass, so a full set of passes never waits on the cap. A query that fails
+    with a timeout or connection error is reported as ``None``, the same as an empty
+    response, so the result always lines up with ``axons``. Any other exception is
+    re-raised once every query has finished.
+
+    Args:
+        self: The validator neuron object.
+        axons: The miner axons to query.
+        synapse: The request to send to every axon.
+
+    Returns:
+        list: The deserialized response of each axon, in the order of ``axons``.
+    """
+    if getattr(self, "_query_semaphore", None) is None:
+        self._query_semaphore = asyncio.Semaphore(
+            self.config.neuron.sample_size * self.config.neuron.num_concurrent_forwards
+        )
+
+    async def query(axon):
+        async with self._query_semaphore:
+            responses = await self.dendrite(
+                axons=[axon],
+                synapse=synapse,
+                # All responses have the deserialize function called on them before returning.
+                # You are encouraged to define your own deserialization function.
+                deserialize=True,
+                timeout=self.config.neuron.timeout,
+            )
+        return responses[0]
+
+    responses = await asyncio.gather(
+        *(query(axon) for axon in axons), return_exceptions=True
+    )
+    for i, response in enumerate(responses):
+        if isinstance(response, _NETWORK_ERRORS):
+            bt.logging.debug(
+                f"Query to {axons[i]} failed: {type(response).__name__}: {response}"
+            )
+            responses[i] = None
+        elif isinstance(response, BaseException):
+            raise response
+    return responses
+
 
 async def forward(self: "BaseValidatorNeuron") -> None:
     """
@@ -42,32 +104,47 @@ async def forward(self: "BaseValidatorNeuron") -> None:
         # get_random_uids is an example method, but you can replace it with your own.
         miner_uids = get_random_uids(self, k=self.config.neuron.sample_size)
 
-        if len(miner_uids) == 0:
+        # Skip the step when no miner is servable (e.g. a quiescent subnet or cold start).
+        # The available uids are cached per metagraph sync, so an empty set costs no sampling.
+        num_miners = len(miner_uids)
+        if num_miners == 0:
             bt.logging.warning("No available miners to query. Skipping forward pass.")
             return
 
+        # Gather the selected miner axons from the per-sync snapshot in one C-level call.
+        axons = itemgetter(*miner_uids)(self._axons_tuple)
+        axons = list(axons) if num_miners > 1 else [axons]
+
+        # Reuse one dummy query across steps, built on first use. This simply contains a
+        # single integer; the dendrite copies it per axon before sending it.
+        synapse = getattr(self, "_synapse_proto", None)
+        if synapse is None:
+            synapse = self._synapse_proto = Dummy.model_construct(dummy_input=0)
+        synapse.dummy_input = self.step
+
         # The dendrite client queries the network.
-        responses = await self.dendrite(
+        responses = await query_miners(
+            self,
             # Send the query to selected miner axons in the network.
-            axons=[self.metagraph.axons[uid] for uid in miner_uids],
-            # Construct a dummy query. This simply contains a single integer.
-            synapse=Dummy(dummy_input=self.step),
-            # All responses have the deserialize function called on them before returning.
-            # You are encouraged to define your own deserialization function.
-            deserialize=True,
-            timeout=self.config.neuron.timeout,
+            axons=axons,
+            synapse=synapse,
         )
 
-        # Log the results for monitoring purposes.
-        bt.logging.debug(f"Received {len(responses)} responses from {len(miner_uids)} miners")
+        # Log the results for monitoring purposes. Guard on the level so the messages
+        # (notably the stringified rewards array) are only built when DEBUG is enabled.
+        debug_enabled = _bt_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            bt.logging.debug(f"Received {len(responses)} responses from {num_miners} miners")
 
-        # Define how the validator scores responses (see template/validator/reward.py).
-        rewards = get_rewards(self, query=self.step, responses=responses)
+        # Define how the validator scores responses (see reward() in template/validator/reward.py).
+        responses_arr = responses_to_array(responses)
+        rewards = get_rewards(self, query=self.step, responses=responses_arr)
 
         if len(rewards) > 0:
-            bt.logging.debug(f"Scored responses: {rewards}")
+            if debug_enabled:
+                bt.logging.debug(f"Scored responses: {rewards}")
             # Update the scores based on the rewards. You may want to define your own update_scores function for custom behavior.
-            self.update_scores(rewards, miner_uids.tolist())
+            self.update_scores(rewards, miner_uids)
         else:
             bt.logging.warning("No valid rewards generated from responses.")
             
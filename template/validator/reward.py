@@ -16,27 +16,76 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import math
 import numpy as np
-from typing import List
-import bittensor as bt
+from typing import Any, List, Union
 
+_INT64_MIN, _INT64_MAX = int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)
 
-def reward(query: int, response: int) -> float:
+
+def responses_to_array(responses: List[Any]) -> np.ndarray:
+    """
+    Packs miner responses into an int64 array, one entry per response.
+
+    Missing (None), non-numeric, non-finite and out-of-int64-range responses become -1,
+    which never matches a valid expected output since queries are non-negative.
+
+    Args:
+        responses (List[Any]): Responses as returned by the dendrite.
+
+    Returns:
+        np.ndarray: The responses cast to int64.
+    """
+
+    def to_int(response: Any) -> int:
+        if isinstance(response, float):
+            if not math.isfinite(response):
+                return -1
+            response = int(response)
+        elif not isinstance(response, int):
+            return -1
+        # Values outside int64 would make np.fromiter raise OverflowError.
+        return response if _INT64_MIN <= response <= _INT64_MAX else -1
+
+    return np.fromiter(
+        (to_int(response) for response in responses),
+        dtype=np.int64,
+        count=len(responses),
+    )
+
+
+def dummy_rewards(query: int, responses: np.ndarray) -> np.ndarray:
+    """
+    Scores int64 Dummy responses: 1.0 where a response equals ``query * 2``, else 0.0.
+
+    Args:
+        query (int): The query sent to the miners.
+        responses (np.ndarray): The responses as packed by :func:`responses_to_array`.
+
+    Returns:
+        np.ndarray: float32 rewards, one per response.
+    """
+    return np.equal(responses, query * 2).astype(np.float32)
+
+
+def reward(query: int, response: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Reward the miner response to the dummy request. This method returns a reward
     value for the miner, which is used to update the miner's score.
 
+    get_rewards calls this once with all responses packed by :func:`responses_to_array`,
+    so keep custom logic elementwise; it then works for a single int as well.
+
     Returns:
-    - float: The reward value for the miner.
+    - Union[float, np.ndarray]: The reward value for the miner, or one per response.
     """
-    bt.logging.info(f"In rewards, query val: {query}, response val: {response}, rewards val: {1.0 if response == query * 2 else 0}")
-    return 1.0 if response == query * 2 else 0
+    return dummy_rewards(query, response)
 
 
 def get_rewards(
     self,
     query: int,
-    responses: List[float],
+    responses: Union[np.ndarray, List[Any]],
 ) -> np.ndarray:
     """
     Returns an array of rewards for the given query and responses.
@@ -44,24 +93,13 @@ def get_rewards(
     Args:
         self: The validator instance.
         query (int): The query sent to the miner.
-        responses (List[float]): A list of responses from the miner.
+        responses (Union[np.ndarray, List[Any]]): The miner responses, either as returned
+            by the dendrite or already packed with :func:`responses_to_array`.
 
     Returns:
-        np.ndarray: An array of rewards for the given query and responses.
+        np.ndarray: One reward per response; missing or invalid responses score 0.
     """
-    # Get all the reward results by iteratively calling your reward() function.
-    # Cast response to int as the reward function expects an int type for response.
-    
-    # Remove any None values and filter invalid responses
-    valid_responses = [
-        response for response in responses 
-        if response is not None and isinstance(response, (int, float))
-    ]
-    
-    if not valid_responses:
-        return np.array([], dtype=np.float32)
-    
-    return np.array(
-        [reward(query, int(response)) for response in valid_responses],
-        dtype=np.float32
-    )
+    if not isinstance(responses, np.ndarray):
+        responses = responses_to_array(responses)
+
+    return np.asarray(reward(query, responses), dtype=np.float32)
@@ -15,6 +15,9 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import dataclasses
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Union
 from bittensor import (
     Balance,
@@ -23,6 +26,7 @@ from bittensor import (
     PrometheusInfo,
     __ss58_format__,
 )
+from bittensor.mock.subtensor_mock import MockSubtensor as _BtMockSubtensor
 from bittensor.mock.wallet_mock import MockWallet as _MockWallet
 from bittensor.mock.wallet_mock import get_mock_coldkey as _get_mock_coldkey
 from bittensor.mock.wallet_mock import get_mock_hotkey as _get_mock_hotkey
@@ -32,6 +36,13 @@ from bittensor.mock.wallet_mock import get_mock_wallet as _get_mock_wallet
 from rich.console import Console
 from rich.text import Text
 
+from template.mock import MockMetagraph, MockSubtensor
+
+# Shared capture console for MockConsole; width 1000 avoids truncation.
+_shared_console = Console(
+    width=1000, no_color=True, markup=False, highlight=False
+)
+
 
 def __mock_wallet_factory__(*args, **kwargs) -> _MockWallet:
     """Returns a mock wallet object."""
@@ -40,7 +51,10 @@ def __mock_wallet_factory__(*args, **kwargs) -> _MockWallet:
 
 class CLOSE_IN_VALUE:
     """Helper class for approximate value comparison in tests."""
-    
+
+    __slots__ = ("value", "tolerance")
+    __hash__ = None
+
     def __init__(
         self,
         value: Union[float, int, Balance],
@@ -66,49 +80,38 @@ class CLOSE_IN_VALUE:
         Returns:
             True if values are within tolerance, False otherwise
         """
-        # True if other is in [value - tolerance, value + tolerance]
-        # or if value is in [other - tolerance, other + tolerance]
-        return (
-            (self.value - self.tolerance) <= other
-            and other <= (self.value + self.tolerance)
-        ) or (
-            (other - self.tolerance) <= self.value
-            and self.value <= (other + self.tolerance)
-        )
-
-
-def get_mock_neuron(**kwargs) -> NeuronInfo:
-    """
-    Returns a mock neuron with the given kwargs overriding the default values.
-    
-    Args:
-        **kwargs: Keyword arguments to override default neuron values
-        
-    Returns:
-        NeuronInfo: A mock neuron object
-    """
-    mock_neuron_d = {
+        # Both interval checks ([value - tolerance, value + tolerance] containing other,
+        # and vice versa) reduce to |value - other| <= tolerance. Balance supports abs().
+        return abs(self.value - other) <= self.tolerance
+
+
+# Immutable default neuron fields shared by every get_mock_neuron call; the axon and
+# prometheus info objects are shared too, so tests must not mutate them. Mutable
+# containers (stake, bonds, weights, stake_dict) are created per call, and the axon
+# info is copied when the neuron's hotkey or coldkey is overridden.
+_MOCK_AXON_INFO = AxonInfo(
+    version=1,
+    ip=0,
+    port=0,
+    ip_type=0,
+    hotkey="some_hotkey",
+    coldkey="some_coldkey",
+    protocol=0,
+    placeholder1=0,
+    placeholder2=0,
+)
+_MOCK_PROMETHEUS_INFO = PrometheusInfo(block=0, version=1, ip=0, port=0, ip_type=0)
+_MOCK_NEURON_TEMPLATE = MappingProxyType(
+    {
         "netuid": -1,  # mock netuid
-        "axon_info": AxonInfo(
-            block=0,
-            version=1,
-            ip=0,
-            port=0,
-            ip_type=0,
-            protocol=0,
-            placeholder1=0,
-            placeholder2=0,
-        ),
-        "prometheus_info": PrometheusInfo(
-            block=0, version=1, ip=0, port=0, ip_type=0
-        ),
+        "axon_info": _MOCK_AXON_INFO,
+        "prometheus_info": _MOCK_PROMETHEUS_INFO,
         "validator_permit": True,
         "uid": 1,
         "hotkey": "some_hotkey",
         "coldkey": "some_coldkey",
         "active": 0,
         "last_update": 0,
-        "stake": {"some_coldkey": 1e12},
         "total_stake": 1e12,
         "rank": 0.0,
         "trust": 0.0,
@@ -117,13 +120,57 @@ def get_mock_neuron(**kwargs) -> NeuronInfo:
         "incentive": 0.0,
         "dividends": 0.0,
         "emission": 0.0,
-        "bonds": [],
-        "weights": [],
-        "stake_dict": {},
         "pruning_score": 0.0,
         "is_null": False,
     }
+)
+
+
+def reset_mock_chain() -> None:
+    """
+    Clears the process-wide mock chain state shared by every MockSubtensor.
+
+    Metagraphs already returned by get_mock_metagraph stay usable, since they were synced
+    when built, but their miners are no longer registered on the chain.
+    """
+    _BtMockSubtensor.reset()
+
+
+# Miners registered on every subnet built by get_mock_metagraph; tests that need fewer
+# use the first n axons.
+MOCK_MAX_N = 64
+
 
+@lru_cache(maxsize=None)
+def get_mock_metagraph(netuid: int) -> MockMetagraph:
+    """
+    Returns a MockMetagraph for ``netuid`` with ``MOCK_MAX_N`` registered miners, built once.
+
+    bt.MockSubtensor keeps a single process-wide chain state, so each netuid is registered
+    only once per session; tests needing n miners slice ``axons[:n]``. Tests share the
+    returned instance, so they must not mutate it; deepcopy it if needed.
+    """
+    subtensor = MockSubtensor(netuid=netuid, n=MOCK_MAX_N)
+    return MockMetagraph(netuid=netuid, subtensor=subtensor)
+
+
+def get_mock_neuron(**kwargs) -> NeuronInfo:
+    """
+    Returns a mock neuron with the given kwargs overriding the default values.
+    
+    Args:
+        **kwargs: Keyword arguments to override default neuron values
+        
+    Returns:
+        NeuronInfo: A mock neuron object
+    """
+    mock_neuron_d = dict(
+        _MOCK_NEURON_TEMPLATE,
+        stake={"some_coldkey": 1e12},
+        bonds=[],
+        weights=[],
+        stake_dict={},
+    )
     mock_neuron_d.update(kwargs)  # update with kwargs
 
     # Auto-calculate stake if coldkey is provided
@@ -134,9 +181,15 @@ def get_mock_neuron(**kwargs) -> NeuronInfo:
     if kwargs.get("total_stake") is None:
         mock_neuron_d["total_stake"] = sum(mock_neuron_d["stake"].values())
 
-    mock_neuron = NeuronInfo._neuron_dict_to_namespace(mock_neuron_d)
+    # Keep the axon info's keys in step with the neuron's unless it was given explicitly.
+    if "axon_info" not in kwargs and ("hotkey" in kwargs or "coldkey" in kwargs):
+        mock_neuron_d["axon_info"] = dataclasses.replace(
+            _MOCK_AXON_INFO,
+            hotkey=mock_neuron_d["hotkey"],
+            coldkey=mock_neuron_d["coldkey"],
+        )
 
-    return mock_neuron
+    return NeuronInfo(**mock_neuron_d)
 
 
 def get_mock_neuron_by_uid(uid: int, **kwargs) -> NeuronInfo:
@@ -200,18 +253,16 @@ class MockConsole:
             *args: Arguments to print
             **kwargs: Keyword arguments for print
         """
-        console = Console(
-            width=1000, no_color=True, markup=False
-        )  # set width to 1000 to avoid truncation
-        console.begin_capture()
-        console.print(*args, **kwargs)
-        self.captured_print = console.end_capture()
+        _shared_console.begin_capture()
+        _shared_console.print(*args, **kwargs)
+        self.captured_print = _shared_console.end_capture()
 
     def clear(self, *args, **kwargs):
         """Clear the console (no-op for mock)."""
         pass
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def remove_rich_syntax(text: str) -> str:
         """
         Removes rich syntax from the given text.
@@ -18,15 +18,39 @@
 
 import pytest
 import asyncio
+import numpy as np
 import bittensor as bt
-from template.mock import MockDendrite, MockMetagraph, MockSubtensor
+from template.api.get_query_axons import ping_uids
+from template.mock import MockDendrite, MockSubtensor
 from template.protocol import Dummy
+from tests.helpers import get_mock_metagraph, get_mock_neuron, get_mock_neuron_by_uid
+
+
+@pytest.fixture(scope="module")
+def loop():
+    """Event loop shared by every async test in this module."""
+    try:
+        import uvloop
+
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def fresh_mock_chain():
+    """Gives the test an empty mock chain and clears what it registered afterwards."""
+    bt.MockSubtensor.reset()
+    yield
+    bt.MockSubtensor.reset()
 
 
 @pytest.mark.parametrize("netuid", [1, 2, 3])
 @pytest.mark.parametrize("n", [2, 4, 8, 16, 32, 64])
 @pytest.mark.parametrize("wallet", [bt.MockWallet(), None])
-def test_mock_subtensor(netuid, n, wallet):
+def test_mock_subtensor(fresh_mock_chain, netuid, n, wallet):
     """Test MockSubtensor creation and neuron registration."""
     subtensor = MockSubtensor(netuid=netuid, n=n, wallet=wallet)
     neurons = subtensor.neurons(netuid=netuid)
@@ -56,14 +80,29 @@ def test_mock_subtensor(netuid, n, wallet):
         )
 
 
+def test_mock_neuron():
+    """Test mock NeuronInfo construction from the shared defaults."""
+    neuron = get_mock_neuron()
+    assert isinstance(neuron, bt.NeuronInfo)
+    assert neuron.hotkey == neuron.axon_info.hotkey == "some_hotkey"
+    assert neuron.total_stake == 1e12
+
+    # Overridden keys flow into the stake and axon info; containers are not shared.
+    neuron = get_mock_neuron_by_uid(3)
+    assert neuron.uid == 3
+    assert neuron.axon_info.hotkey == neuron.hotkey
+    assert neuron.axon_info.coldkey == neuron.coldkey
+    assert neuron.stake == {neuron.coldkey: 1e12}
+    assert neuron.bonds is not get_mock_neuron().bonds
+
+
 @pytest.mark.parametrize("n", [16, 32, 64])
 def test_mock_metagraph(n):
     """Test MockMetagraph creation and axon configuration."""
-    mock_subtensor = MockSubtensor(netuid=1, n=n)
-    mock_metagraph = MockMetagraph(subtensor=mock_subtensor)
+    mock_metagraph = get_mock_metagraph(netuid=1)
     
     # Check axons
-    axons = mock_metagraph.axons
+    axons = mock_metagraph.axons[:n]
     assert len(axons) == n
     
     # Check ip and port
@@ -77,7 +116,7 @@ def test_mock_metagraph(n):
 @pytest.mark.parametrize("min_time", [0, 0.05, 0.1])
 @pytest.mark.parametrize("max_time", [0.1, 0.15, 0.2])
 @pytest.mark.parametrize("n", [4, 16, 64])
-def test_mock_dendrite_timings(timeout, min_time, max_time, n):
+def test_mock_dendrite_timings(loop, timeout, min_time, max_time, n):
     """Test MockDendrite timing behavior and response handling."""
     mock_wallet = bt.MockWallet()
     mock_dendrite = MockDendrite(mock_wallet)
@@ -86,9 +125,7 @@ def test_mock_dendrite_timings(timeout, min_time, max_time, n):
     mock_dendrite.min_time = min_time
     mock_dendrite.max_time = max_time
     
-    mock_subtensor = MockSubtensor(netuid=1, n=n)
-    mock_metagraph = MockMetagraph(subtensor=mock_subtensor)
-    axons = mock_metagraph.axons
+    axons = get_mock_metagraph(netuid=1).axons[:n]
 
     async def run():
         """Execute the dendrite query."""
@@ -96,36 +133,92 @@ def test_mock_dendrite_timings(timeout, min_time, max_time, n):
             axons=axons,
             synapse=Dummy(dummy_input=42),
             timeout=timeout,
-            deserialize=True,
+            # Keep the synapses so the dendrite terminal info can be checked.
+            deserialize=False,
         )
 
-    responses = asyncio.run(run())
+    responses = loop.run_until_complete(run())
     
     # Validate responses
     for synapse in responses:
         assert hasattr(synapse, "dendrite")
         assert isinstance(synapse.dendrite, bt.TerminalInfo)
 
-        dendrite = synapse.dendrite
-        
         # Check required fields
         required_fields = ("process_time", "status_code", "status_message")
         for field in required_fields:
-            assert hasattr(dendrite, field)
-            assert getattr(dendrite, field) is not None
-
-        # Validate timing constraints
-        process_time = float(dendrite.process_time)
-        assert min_time <= process_time <= max_time + 0.1
-        
-        # Validate status codes based on timing
-        if process_time >= timeout + 0.1:
-            assert dendrite.status_code == 408
-            assert dendrite.status_message == "Timeout"
-            # Timeout responses should have default output (input value)
-            assert synapse == 42
-        elif process_time < timeout:
-            assert dendrite.status_code == 200
-            assert dendrite.status_message == "OK"
-            # Successful responses should have processed output (input * 2)
-            assert synapse == 84  # 42 * 2
+            assert getattr(synapse.dendrite, field) is not None
+
+    # Gather the per-response values once and check them as arrays.
+    count = len(responses)
+    process_times = np.fromiter(
+        (float(synapse.dendrite.process_time) for synapse in responses),
+        dtype=np.float64,
+        count=count,
+    )
+    status_codes = np.fromiter(
+        (synapse.dendrite.status_code for synapse in responses),
+        dtype=np.int32,
+        count=count,
+    )
+    status_messages = np.array(
+        [synapse.dendrite.status_message for synapse in responses], dtype=object
+    )
+    outputs = np.fromiter(
+        (synapse.dummy_output for synapse in responses), dtype=np.int64, count=count
+    )
+
+    # Validate timing constraints
+    assert ((process_times >= min_time) & (process_times <= max_time + 0.1)).all()
+
+    # Validate status codes based on timing
+    timed_out = process_times >= timeout + 0.1
+    assert (status_codes[timed_out] == 408).all()
+    assert (status_messages[timed_out] == "Timeout").all()
+    # Timeout responses should have default output (input value)
+    assert (outputs[timed_out] == 42).all()
+
+    on_time = process_times < timeout
+    assert (status_codes[on_time] == 200).all()
+    assert (status_messages[on_time] == "OK").all()
+    # Successful responses should have processed output (input * 2)
+    assert (outputs[on_time] == 84).all()  # 42 * 2
+
+
+@pytest.mark.parametrize("concurrency", [4, 16])
+def test_ping_uids_stops_at_target(loop, concurrency):
+    """Test that ping_uids returns once target pings succeed and cancels the rest."""
+    # A subnet no other test registers on, so its miners cannot collide with theirs.
+    metagraph = get_mock_metagraph(netuid=4)
+    fast_hotkeys = {axon.hotkey for axon in metagraph.axons[:3]}
+    completed = []
+
+    class SlowTailDendrite(MockDendrite):
+        """Answers the first three axons at once and stalls on every other one."""
+
+        async def forward(self, axons, *args, **kwargs):
+            if axons[0].hotkey not in fast_hotkeys:
+                await asyncio.sleep(5)
+            responses = await super().forward(axons, *args, **kwargs)
+            completed.append(axons[0].hotkey)
+            return responses
+
+    dendrite = SlowTailDendrite(bt.MockWallet())
+    dendrite.min_time = dendrite.max_time = 0
+
+    successful_uids, failed_uids = loop.run_until_complete(
+        ping_uids(
+            dendrite,
+            metagraph,
+            list(range(16)),
+            timeout=10,
+            target=3,
+            concurrency=concurrency,
+        )
+    )
+
+    assert sorted(successful_uids) == [0, 1, 2]
+    assert sorted(failed_uids) == list(range(3, 16))
+    # Only the fast pings ran to completion; the slow ones were cancelled, not awaited.
+    assert sorted(completed) == sorted(fast_hotkeys)
+    assert not asyncio.all_tasks(loop)
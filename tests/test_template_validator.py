@@ -16,16 +16,21 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import sys
+import types
+import asyncio
 import unittest
+from unittest import mock
 import torch
 import numpy as np
-import bittensor as bt
 
 from neurons.validator import Validator
 from template.base.validator import BaseValidatorNeuron
 from template.protocol import Dummy
-from template.utils.uids import get_random_uids
+from template.utils.uids import get_cached_available_uids, get_random_uids
+from template.validator.forward import query_miners
 from template.validator.reward import get_rewards
+from tests.helpers import reset_mock_chain
 
 
 class TemplateValidatorNeuronTestCase(unittest.TestCase):
@@ -36,22 +41,33 @@ class TemplateValidatorNeuronTestCase(unittest.TestCase):
     and reward calculation scenarios.
     """
 
-    def setUp(self):
-        """Set up test fixtures before each test method."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the validator once for all test methods."""
+        # The mock chain is process-wide; start from an empty one so the validator's
+        # registrations cannot collide with those of other test modules.
+        reset_mock_chain()
+
         # Create mock configuration
         config = BaseValidatorNeuron.config()
+        config.mock = True
         config.wallet._mock = True
-        config.metagraph._mock = True
         config.subtensor._mock = True
         config.neuron.sample_size = 10
         
-        self.neuron = Validator(config)
-        self.miner_uids = get_random_uids(self.neuron, k=10)
+        cls.neuron = Validator(config)
+        cls.miner_uids = get_random_uids(cls.neuron, k=10)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all test methods."""
+        if hasattr(cls.neuron, 'close'):
+            cls.neuron.close()
+        reset_mock_chain()
 
-    def tearDown(self):
-        """Clean up after each test method."""
-        if hasattr(self.neuron, 'close'):
-            self.neuron.close()
+    def setUp(self):
+        """Reset mutable validator state before each test method."""
+        self.neuron.scores = np.zeros_like(self.neuron.scores)
 
     def test_validator_initialization(self):
         """Test that validator initializes correctly."""
@@ -107,7 +123,7 @@ class TemplateValidatorNeuronTestCase(unittest.TestCase):
         rewards_with_nan[0] = float("nan")
 
         # Test that update_scores handles NaN gracefully
-        with self.assertLogs(bt.logging, level="WARNING") as log_context:
+        with self.assertLogs("bittensor", level="WARNING") as log_context:
             self.neuron.update_scores(rewards_with_nan, self.miner_uids)
         
         # Verify warning was logged
@@ -125,16 +141,99 @@ class TemplateValidatorNeuronTestCase(unittest.TestCase):
         expected_rewards = np.array([1.0, 1.0, 0.0, 1.0, 0.0], dtype=np.float32)
         np.testing.assert_array_equal(rewards, expected_rewards)
 
+    def test_reward_with_invalid_responses(self):
+        """Test that missing and invalid responses score 0 in place."""
+        test_input = 42
+        # None, non-numeric and out-of-int64-range responses.
+        responses = [84, None, "x", 2**70, -(2**70), 84.0]
+
+        rewards = get_rewards(self.neuron, query=test_input, responses=responses)
+
+        # One reward per response, aligned with the queried uids.
+        expected_rewards = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 1.0], dtype=np.float32)
+        np.testing.assert_array_equal(rewards, expected_rewards)
+
+    def test_query_miners_with_network_error(self):
+        """Test that a failed query yields None without shifting the other responses."""
+        axons = [self.neuron.metagraph.axons[uid] for uid in self.miner_uids[:3]]
+        dendrite = self.neuron.dendrite
+
+        async def flaky_dendrite(axons, **kwargs):
+            if axons[0] is failing_axon:
+                raise exception
+            return await dendrite(axons=axons, **kwargs)
+
+        failing_axon = axons[1]
+        exception = ConnectionError("connection reset")
+        with mock.patch.object(self.neuron, "dendrite", flaky_dendrite):
+            responses = self.neuron.loop.run_until_complete(
+                query_miners(self.neuron, axons, Dummy(dummy_input=42))
+            )
+        self.assertEqual(responses, [84, None, 84])
+
+        # Anything other than a network failure is a validator bug and propagates.
+        exception = TypeError("bad synapse")
+        with mock.patch.object(self.neuron, "dendrite", flaky_dendrite):
+            with self.assertRaises(TypeError):
+                self.neuron.loop.run_until_complete(
+                    query_miners(self.neuron, axons, Dummy(dummy_input=42))
+                )
+
     def test_get_random_uids(self):
         """Test that get_random_uids returns valid UIDs."""
         uids = get_random_uids(self.neuron, k=5)
         
         self.assertEqual(len(uids), 5)
-        self.assertTrue(all(isinstance(uid, int) for uid in uids))
-        self.assertTrue(all(0 <= uid < len(self.neuron.metagraph.axons) for uid in uids))
+        self.assertIsInstance(uids, np.ndarray)
+        self.assertEqual(uids.dtype, np.int64)
+        self.assertTrue(
+            ((uids >= 0) & (uids < len(self.neuron.metagraph.axons))).all()
+        )
         
         # Check for uniqueness
-        self.assertEqual(len(uids), len(set(uids)))
+        self.assertEqual(np.unique(uids).size, uids.size)
+
+    def test_get_random_uids_with_exclude(self):
+        """Test that excluded uids are skipped, and only used to top up to k."""
+        avail_uids = get_cached_available_uids(self.neuron)
+        self.assertGreaterEqual(avail_uids.size, 5)
+
+        # Enough non-excluded candidates: no excluded uid is returned.
+        exclude = frozenset(avail_uids[:2].tolist())
+        uids = get_random_uids(self.neuron, k=3, exclude=exclude)
+        self.assertEqual(uids.size, 3)
+        self.assertFalse(np.isin(uids, list(exclude)).any())
+
+        # Fewer non-excluded candidates than k: all of them are returned, topped up
+        # with distinct excluded but available uids.
+        exclude = avail_uids[:-2].tolist()
+        uids = get_random_uids(self.neuron, k=5, exclude=exclude)
+        self.assertEqual(uids.size, 5)
+        self.assertEqual(np.unique(uids).size, 5)
+        self.assertTrue(np.isin(avail_uids[-2:], uids).all())
+        self.assertTrue(np.isin(uids, avail_uids).all())
+
+    def test_forward_loop_uses_uvloop_when_enabled(self):
+        """Test that --neuron.uvloop drives forward passes with a uvloop loop."""
+        uvloop_loop = asyncio.new_event_loop()
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.new_event_loop = lambda: uvloop_loop
+        try:
+            with mock.patch.object(self.neuron.config.neuron, "uvloop", True), \
+                    mock.patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+                self.assertIs(self.neuron._make_forward_loop(), uvloop_loop)
+        finally:
+            asyncio.set_event_loop(self.neuron.loop)
+            uvloop_loop.close()
+
+    def test_forward_loop_falls_back_without_uvloop(self):
+        """Test that a missing uvloop falls back to the default loop with a warning."""
+        # A None entry in sys.modules makes the import raise ImportError.
+        with mock.patch.object(self.neuron.config.neuron, "uvloop", True), \
+                mock.patch.dict(sys.modules, {"uvloop": None}):
+            with self.assertLogs("bittensor", level="WARNING"):
+                loop = self.neuron._make_forward_loop()
+        self.assertIs(loop, asyncio.get_event_loop())
 
     @unittest.skip("TODO: Implement test for single step execution")
     def test_run_single_step(self):
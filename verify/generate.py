@@ -45,8 +45,8 @@ def generate_signature(wallet_name: str, message: str, output_file: str) -> bool
     full_message = f"[{timestamp}] {message}"
 
     try:
-        # Sign the message
-        signature = keypair.sign(data=full_message)
+        # Sign the UTF-8 bytes of the message (what the keypair would encode a str to)
+        signature = keypair.sign(data=full_message.encode("utf-8"))
     except Exception as e:
         print(f"Error: Failed to sign message: {e}")
         return False
@@ -61,8 +61,7 @@ def generate_signature(wallet_name: str, message: str, output_file: str) -> bool
     # Write to file
     output_path = Path(output_file)
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(file_contents)
+        output_path.write_bytes(file_contents.encode("utf-8"))
     except IOError as e:
         print(f"Error: Failed to write to file '{output_file}': {e}")
         return False